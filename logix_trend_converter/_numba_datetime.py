@@ -0,0 +1,87 @@
+# This module requires the optional dependency `numba`, so it is only imported (by
+#   `converter._parse_date_column_numba()`) when a snapshot is large enough to benefit from it.
+
+# external packages
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, parallel=True)
+def parse_datetime_bytes(
+    date_bytes: np.ndarray, time_bytes: np.ndarray, millitm: np.ndarray
+) -> tuple[np.ndarray, bool]:
+    """
+    Parses fixed-width ASCII date/time fields into nanoseconds since the Unix epoch, using only
+    integer arithmetic. Compiled (with rows parsed in parallel) on first use; see
+    `converter._parse_date_column_numba()`.
+
+    Args:
+        date_bytes (`numpy.ndarray<uint8>` of shape (n, 10)):
+            The "Date" column as raw ASCII bytes (format: YYYY-MM-DD).
+
+        time_bytes (`numpy.ndarray<uint8>` of shape (n, 8)):
+            The "Time" column as raw ASCII bytes (format: HH:MM:SS).
+
+        millitm (`numpy.ndarray<int64>` of shape (n,)):
+            The "Millitm" column.
+
+    Returns:
+        `tuple` of (`numpy.ndarray<int64>` of nanoseconds since epoch, `bool` of whether every row
+        was a valid date/time). If any row is invalid, the returned nanoseconds are meaningless.
+    """
+    n_rows = date_bytes.shape[0]
+    result = np.empty(n_rows, dtype=np.int64)
+    is_valid = np.ones(n_rows, dtype=np.bool_)
+
+    for i in numba.prange(n_rows):
+        d = date_bytes[i]
+        t = time_bytes[i]
+
+        # check separators and digits ("0" = 48, "9" = 57, "-" = 45, ":" = 58)
+        if d[4] != 45 or d[7] != 45 or t[2] != 58 or t[5] != 58:
+            is_valid[i] = False
+            continue
+        for j in (0, 1, 2, 3, 5, 6, 8, 9):
+            if d[j] < 48 or d[j] > 57:
+                is_valid[i] = False
+        for j in (0, 1, 3, 4, 6, 7):
+            if t[j] < 48 or t[j] > 57:
+                is_valid[i] = False
+        if not is_valid[i]:
+            continue
+
+        year = (d[0] - 48) * 1000 + (d[1] - 48) * 100 + (d[2] - 48) * 10 + (d[3] - 48)
+        month = (d[5] - 48) * 10 + (d[6] - 48)
+        day = (d[8] - 48) * 10 + (d[9] - 48)
+        hour = (t[0] - 48) * 10 + (t[1] - 48)
+        minute = (t[3] - 48) * 10 + (t[4] - 48)
+        second = (t[6] - 48) * 10 + (t[7] - 48)
+
+        # check ranges (years outside 1678..2261 would overflow datetime64[ns])
+        is_leap_year = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+        if month == 2:
+            days_in_month = 29 if is_leap_year else 28
+        elif month == 4 or month == 6 or month == 9 or month == 11:
+            days_in_month = 30
+        else:
+            days_in_month = 31
+        if (
+            year < 1678 or year > 2261
+            or month < 1 or month > 12 or day < 1 or day > days_in_month
+            or hour > 23 or minute > 59 or second > 59
+        ):
+            is_valid[i] = False
+            continue
+
+        # days since 1970-01-01 (from "days_from_civil", http://howardhinnant.github.io/date_algorithms.html)
+        y = year - 1 if month <= 2 else year
+        era = y // 400
+        year_of_era = y - era * 400
+        day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+        day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+        days = era * 146097 + day_of_era - 719468
+
+        seconds = days * 86400 + hour * 3600 + minute * 60 + second
+        result[i] = (seconds * 1000 + millitm[i]) * 1_000_000
+
+    return result, bool(is_valid.all())
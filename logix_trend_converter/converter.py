@@ -1,15 +1,22 @@
 # standard library
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import functools
+import multiprocessing
+import os
 import re
 import logging
 
 # external packages
+import numpy as np
 import pandas as pd
 from .dbf import Dbf5
 
 # dunders
 __all__ = [
     "convert_file_to_pd_dataframe",
+    "convert_files_to_pd_dataframe",
 ]
 
 # logging setup
@@ -29,6 +36,113 @@ _HEADER_FILE_ENCODING = (
     "cp850"  # "Code page 850" - https://en.wikipedia.org/wiki/Code_page_850
 )
 
+# The IDX file is tokenized as raw bytes, and only the captured pen numbers/names get decoded.
+#   The whitespace class lists the bytes which decode (as cp850) to whitespace characters, so that
+#   tokens split the same way as they would with `\s` on the decoded text.
+_IDX_WHITESPACE = rb"\t\n\x0b\x0c\r\x1c-\x1f \xff"
+_IDX_TOKEN_RE = re.compile(  # pen number, followed by pen name
+    rb"[%s](\d+)([^%s]*)[%s]?" % (_IDX_WHITESPACE, _IDX_WHITESPACE, _IDX_WHITESPACE)
+)
+
+_NUMBA_MIN_ROWS = 100_000  # below this, numba's compile/dispatch overhead isn't worth it
+
+
+def _coerce_path(file_name_or_path: str | Path) -> Path:
+    """
+    Converts a filename (as a string) or Path-like object to a Path object.
+
+    Args:
+        file_name_or_path (`str` or `Path`)
+            The filename (as a string) or Path object to convert.
+
+    Returns:
+        `Path` of the provided filename. A TypeError is raised for any other type of argument.
+    """
+    return Path(os.fspath(file_name_or_path))
+
+
+def _copy_on_write() -> contextlib.AbstractContextManager:
+    """
+    Pandas' Copy-on-Write mode makes column selections/renames return cheap views, only copying
+    data when it is actually modified. This is always enabled as of pandas 3.0 (where setting the
+    option is deprecated), and not available before pandas 1.5.
+
+    Returns:
+        A context manager which enables Copy-on-Write where needed, otherwise does nothing.
+    """
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return contextlib.nullcontext()
+
+    try:
+        pd.get_option("mode.copy_on_write")
+    except KeyError:
+        return contextlib.nullcontext()
+
+    return pd.option_context("mode.copy_on_write", True)
+
+
+def _as_str_column(column: pd.Series) -> pd.Series:
+    """
+    Returns the column as strings, skipping the conversion (and the copy it makes) for columns
+    that already hold strings, as the "Date" and "Time" columns read from a DBF file do.
+
+    Args:
+        column (`pandas.Series`):
+            The column to convert.
+
+    Returns:
+        `pandas.Series` of strings, which is `column` itself if it already holds strings.
+    """
+    if pd.api.types.is_string_dtype(column.dtype):
+        return column
+
+    return column.astype(str)
+
+
+def _parse_date_column_numba(df: pd.DataFrame) -> pd.Series | None:
+    """
+    Fast path for `_parse_date_column()` on very large snapshots, when numba is installed. The
+    "Date" and "Time" columns are converted to fixed-width byte arrays and parsed by the compiled
+    `_numba_datetime.parse_datetime_bytes()`, with no per-row Python objects or string parsing.
+
+    Args:
+        df (`pandas.DataFrame`):
+            The dataframe to extract date/time columns from (see `_parse_date_column()`).
+
+    Returns:
+        `pandas.Series<datetime64[ns]>` - A series of parsed dates, matched to index of `df`. Or None
+            if numba isn't installed, or the columns aren't in the expected format, in which case the
+            caller should use the general path instead.
+    """
+    if not pd.api.types.is_integer_dtype(df["Millitm"].dtype):
+        return None
+
+    # imported here, as numba is optional (and slow to import)
+    try:
+        from ._numba_datetime import parse_datetime_bytes
+    except ImportError:
+        return None
+
+    try:
+        date_bytes = df["Date"].to_numpy().astype("S")
+        time_bytes = df["Time"].to_numpy().astype("S")
+    except (UnicodeEncodeError, ValueError):
+        return None
+
+    if date_bytes.dtype.itemsize != 10 or time_bytes.dtype.itemsize != 8:
+        return None
+
+    datetime_ns, is_valid = parse_datetime_bytes(
+        date_bytes.view(np.uint8).reshape(-1, 10),
+        time_bytes.view(np.uint8).reshape(-1, 8),
+        df["Millitm"].to_numpy(dtype=np.int64),
+    )
+
+    if not is_valid:
+        return None
+
+    return pd.Series(datetime_ns.view("datetime64[ns]"), index=df.index)
+
 
 def _parse_date_column(df: pd.DataFrame) -> pd.Series:
     """
@@ -38,12 +152,14 @@ def _parse_date_column(df: pd.DataFrame) -> pd.Series:
         Time:       18:45:20        (format: HH:MM:SS with 24-hour time as a string)
         Millitm:    8 or 28 or 128  (format: ### as a string, not padded with zeroes)
 
-    Because Pandas stores fractional seconds as nanoseconds, it tries to help by appending zeroes
-    to the right side of a string for milliseconds until it gets to six digits. As a result, if
-    the milliseconds string is not left-hand padded with zeroes (e.g. "7" rather than "007" for
-    "7 milliseconds") then it will become "700000 ns", erroneously representing 700 milliseconds.
+    Rather than concatenating these into one string and running a strptime() parse on every row,
+    each distinct Date and Time string is parsed only once and the result is mapped back onto
+    every row. Snapshots typically cover a single day (and sub-second sample rates repeat the
+    same Time many times over), so this parses a small fraction of the rows. Millitm is added as
+    an integer number of milliseconds, which also sidesteps the need to left-pad it with zeroes.
 
-    Otherwise this is just a simple string concatenation followed by a strptime() parsing.
+    For very large snapshots, if numba is installed, a compiled parser is used instead (see
+    `_parse_date_column_numba()`).
 
     Args:
         df (`pandas.DataFrame`):
@@ -59,24 +175,91 @@ def _parse_date_column(df: pd.DataFrame) -> pd.Series:
         logger.exception("Dataframe is missing one or more timestamp columns.")
         raise ValueError()
 
-    # convert the milliseconds column type to be zero padded on left
-    milliseconds_str: pd.Series = (
-        df["Millitm"].apply(lambda x_int: f"{x_int:0>3}").astype(str)
-    )
-
-    # assemble a string of the datetime columns combined
-    datetime_str: pd.Series = (
-        df["Date"].astype(str) + " " + df["Time"].astype(str) + "." + milliseconds_str
+    # a snapshot with no records has nothing to parse
+    if len(df) == 0:
+        return pd.Series([], dtype="datetime64[ns]", index=df.index)
+
+    # very large snapshots can be parsed with a compiled fast path, if numba is installed
+    if len(df) >= _NUMBA_MIN_ROWS:
+        datetime_col_parsed = _parse_date_column_numba(df)
+        if datetime_col_parsed is not None:
+            return datetime_col_parsed
+
+    # parse each distinct date (YYYY-MM-DD) once, then map back onto every row
+    date_str: pd.Series = _as_str_column(df["Date"])
+    unique_dates = pd.unique(date_str)
+    if len(unique_dates) == 1:
+        # typical snapshot covering a single day, no need to map back onto each row
+        date_values = pd.to_datetime(unique_dates[0], format=r"%Y-%m-%d")
+    else:
+        date_lookup = pd.Series(
+            pd.to_datetime(unique_dates, format=r"%Y-%m-%d"), index=unique_dates
+        )
+        date_values = date_str.map(date_lookup)
+
+    # same for each distinct time (HH:MM:SS), as an offset from midnight
+    time_str: pd.Series = _as_str_column(df["Time"])
+    unique_times = pd.unique(time_str)
+    time_of_day = pd.to_datetime(unique_times, format=r"%H:%M:%S")  # on 1900-01-01
+    time_lookup = pd.Series(
+        time_of_day - pd.Timestamp(1900, 1, 1), index=unique_times
     )
 
-    # parse by a specified format
-    datetime_col_parsed: pd.Series = pd.to_datetime(
-        datetime_str, format=r"%Y-%m-%d %H:%M:%S.%f"
-    )
+    # combine date, time, and milliseconds
+    datetime_col_parsed: pd.Series = (
+        date_values
+        + time_str.map(time_lookup)
+        + pd.to_timedelta(pd.to_numeric(df["Millitm"]), unit="ms")
+    ).astype("datetime64[ns]")
 
     return datetime_col_parsed
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_header_file_cached(
+    header_file_path: str, mtime_ns: int, size: int
+) -> tuple[tuple[str, str], ...] | None:
+    """
+    Reads, decodes, and tokenizes an IDX header file. Results are cached, so that repeated
+    conversions sharing the same IDX file (e.g. a batch of DBF files from a split trend) only
+    parse it once. The file's modification time and size are part of the cache key, so a file
+    that changes on disk is parsed again.
+
+    Note that the cache is per process: this only helps repeated calls within one process, not
+    `convert_files_to_pd_dataframe()`, where each spawned worker starts with an empty cache.
+
+    Args:
+        header_file_path (`str`)
+            The resolved path to the header (.IDX) file.
+
+        mtime_ns (`int`)
+            The file's modification time in nanoseconds (from `os.stat`), for cache invalidation.
+
+        size (`int`)
+            The file's size in bytes (from `os.stat`), for cache invalidation.
+
+    Returns:
+        `tuple[tuple[str, str], ...]` of (pen number, pen name) tokens, which is empty if the file
+        has no content after decoding, or None if the file could not be decoded.
+    """
+    with open(header_file_path, mode="rb") as idx_file:
+        raw_data: bytes = idx_file.read()
+
+    logger.debug(f"{__name__}: {raw_data=}")
+
+    # break apart the raw bytes, decoding only the captured pen numbers/names
+    try:
+        return tuple(
+            (
+                match.group(1).decode(encoding="ascii"),
+                match.group(2).decode(encoding=_HEADER_FILE_ENCODING),
+            )
+            for match in _IDX_TOKEN_RE.finditer(raw_data)
+        )
+    except UnicodeDecodeError:
+        return None
+
+
 def _parse_header_file(header_file_name_or_path: str | Path) -> dict[str, str] | None:
     """
     RSTrendX provides a sidecar *.IDX file with each DBF snapshot. This file contains the names
@@ -95,14 +278,7 @@ def _parse_header_file(header_file_name_or_path: str | Path) -> dict[str, str] |
             e.g. {'0': 'N100:0', '1': 'F150:1, '2': 'B200.0/0', ...}
     """
     # handle the provided header file name / path
-    if isinstance(header_file_name_or_path, str):
-        header_file_handle: Path = Path(header_file_name_or_path)
-    elif isinstance(header_file_name_or_path, Path):
-        header_file_handle: Path = header_file_name_or_path
-    else:
-        raise TypeError(
-            f"{__name__}: provided argument is not a `str` or `Path` object: {header_file_name_or_path=}"
-        )
+    header_file_handle: Path = _coerce_path(header_file_name_or_path)
 
     # check if file exists
     if not header_file_handle.exists() or not header_file_handle.is_file():
@@ -110,31 +286,20 @@ def _parse_header_file(header_file_name_or_path: str | Path) -> dict[str, str] |
             f"{__name__}: provided argument is not a file or does not exist: {header_file_name_or_path=}"
         )
 
-    # try processing the file
-    decoded_data: str = ""
-    tokens: list[str] = []
-    try:
-        with header_file_handle.open(mode="rb") as idx_file:
-            raw_data: bytes = idx_file.read()
-            decoded_data = raw_data.decode(encoding=_HEADER_FILE_ENCODING)
-
-        logger.debug(f"{__name__}: {decoded_data=}")
-
-        if len(decoded_data) == 0:
-            raise ValueError
-
-        # break apart the decoded text
-        tokens = re.findall(pattern=r"\s\b(\d+)(\S*)\s?", string=decoded_data)
-
-        if len(tokens) == 0:
-            raise ValueError
+    # try processing the file (or fetch the result of having already done so)
+    header_file_stat = header_file_handle.stat()
+    tokens = _parse_header_file_cached(
+        str(header_file_handle.resolve()),
+        header_file_stat.st_mtime_ns,
+        header_file_stat.st_size,
+    )
 
-    except UnicodeDecodeError as u_err:
+    if tokens is None:
         logger.warning(
             "There was an error decoding the IDX header file. Placeholder tag names will be used instead."
         )
         return None  # parent function catches this and creates appropriate number of placeholders
-    except ValueError as val_err:
+    elif len(tokens) == 0:
         logger.warning(
             "The provided IDX header file appears to be empty after decoding. Placeholder tag names will be used instead."
         )
@@ -183,7 +348,157 @@ def _make_placeholder_header_dict(
         )
         raise TypeError
 
-    return {y_int: f"{column_prefix}{y_int:0>2}" for y_int in range(n_columns)}
+    column_numbers = np.arange(n_columns)
+    column_names = np.char.add(
+        column_prefix, np.char.zfill(column_numbers.astype(str), 2)
+    )
+
+    return dict(zip(column_numbers.tolist(), column_names.tolist()))
+
+
+def _convert_dbf_column(
+    raw_values: np.ndarray, field_type: str, encoding: str
+) -> np.ndarray:
+    """
+    Converts one column of raw fixed-width DBF field bytes into a typed array, following the
+    same conversion rules as the row-by-row `Dbf5._get_recs()` reader:
+        "C" (character):    whitespace stripped, decoded to `str`; empty values become NaN
+                            (a column with only empty values is `float64`)
+        "N" (numeric):      `float64` if any value has a decimal point (or is blank/invalid),
+                            otherwise `int64`; unlike `Dbf5`, which keeps them as Python ints,
+                            integers too large for `int64` also make the column `float64`
+        "F" (float):        `float64`, blank/invalid values become NaN
+        "D" (date):         "YYYYMMDD" parsed to `datetime.date`, blank/invalid values become NaN
+                            (unlike `Dbf5`, which raises for impossible dates such as "20230230")
+        "L" (logical):      "T"/"t"/"y" are True, "F"/"f"/"N"/"n" are False, anything else
+                            (e.g. "?") is NaN; the column is `bool` if there are no NaN values
+        (a "D" or "L" column with only NaN values is `float64`, as with "C" columns)
+
+    Args:
+        raw_values (`numpy.ndarray` of bytes):
+            The raw field values for a single column, one element per record.
+
+        field_type (`str`):
+            The single-character DBF field type (one of "C", "N", "F", "D", or "L").
+
+        encoding (`str`):
+            The codec used to decode character fields.
+
+    Returns:
+        `numpy.ndarray` of the converted column values.
+    """
+    if field_type == "L":
+        values = np.full(len(raw_values), np.nan, dtype=object)
+        values[np.isin(raw_values, [b"T", b"t", b"y"])] = True
+        values[np.isin(raw_values, [b"F", b"f", b"N", b"n"])] = False
+        is_missing = pd.isna(values)
+        if not is_missing.any():
+            return values.astype(bool)
+        elif is_missing.all():
+            return values.astype(np.float64)
+        return values
+
+    stripped = np.char.strip(raw_values)
+    is_empty = stripped == b""
+
+    if field_type == "D":
+        parsed = pd.to_datetime(
+            np.char.decode(stripped, encoding="ascii", errors="replace"),
+            format=r"%Y%m%d",
+            errors="coerce",
+        )
+        if parsed.isna().all():
+            return np.full(len(stripped), np.nan, dtype=np.float64)
+        values = np.full(len(stripped), np.nan, dtype=object)
+        values[~parsed.isna()] = parsed[~parsed.isna()].date
+        return values
+
+    if field_type == "C" and not is_empty.all():
+        values = np.char.decode(stripped, encoding=encoding).astype(object)
+        values[is_empty] = np.nan
+        return values
+
+    has_decimal_point = (np.char.find(stripped, b".") >= 0).any()
+    if field_type == "N" and not is_empty.any() and not has_decimal_point:
+        try:
+            return stripped.astype(np.int64)
+        except (ValueError, OverflowError):
+            pass  # fall through to float parsing, invalid values become NaN
+
+    values = np.full(len(stripped), np.nan, dtype=np.float64)
+    try:
+        values[~is_empty] = stripped[~is_empty].astype(np.float64)
+    except ValueError:
+        values[~is_empty] = pd.to_numeric(
+            np.char.decode(stripped[~is_empty], encoding="ascii", errors="replace"),
+            errors="coerce",
+        )
+    return values
+
+
+def _read_dbf_columnar(dbf_file_handle: Path) -> pd.DataFrame:
+    """
+    Reads a DBF file into a dataframe one column at a time, rather than record-by-record.
+
+    The header is parsed with the bundled `Dbf5` class, then the whole record region is read in a
+    single call as a NumPy structured array (one fixed-width bytes field per DBF field). Each column
+    is then converted with vectorized operations, so no Python objects are created per record.
+
+    Files containing field types not supported by `_convert_dbf_column()` fall back to the
+    row-by-row `Dbf5.to_dataframe()` reader, which reports the unsupported type.
+
+    Args:
+        dbf_file_handle (`Path`):
+            The Path object referring to the main data (.DBF) file.
+
+    Returns:
+        `pandas.DataFrame` of the DBF file contents.
+    """
+    dbf = Dbf5(dbf_file_handle)
+
+    if any(field_type not in "CNFDL" for (_, field_type, _) in dbf.fields[1:]):
+        logger.debug(f"Unsupported DBF field type, using row-by-row reader: {dbf.fields=}")
+        return dbf.to_dataframe()
+
+    dbf.f.close()
+
+    record_dtype = np.dtype(
+        [(f"f{i}", f"S{size}") for (i, (_, _, size)) in enumerate(dbf.fields)]
+    )
+    records = np.fromfile(
+        dbf_file_handle, dtype=record_dtype, count=dbf.numrec, offset=dbf.lenheader
+    )
+
+    # a truncated file (e.g. partially copied) has fewer records than its header says
+    if len(records) != dbf.numrec:
+        raise ValueError(
+            f"{__name__}: DBF file is truncated, expected {dbf.numrec} records but found {len(records)}: {dbf_file_handle=}"
+        )
+
+    # skip records marked as deleted (deletion flag is anything other than a space)
+    records = records[records["f0"] == b" "]
+
+    columns = {
+        name: _convert_dbf_column(records[f"f{i}"], field_type, dbf._enc)
+        for (i, (name, field_type, _)) in enumerate(dbf.fields)
+        if i > 0
+    }
+
+    return pd.DataFrame(columns, columns=dbf.columns)
+
+
+def _init_batch_worker(numba_threads: int) -> None:
+    """
+    Initializes a `convert_files_to_pd_dataframe()` worker process. Limits the number of threads
+    numba uses for parallel loops (unless already set), since each worker process would otherwise
+    start one thread per CPU. This must run before numba is imported, which is the case for a
+    freshly spawned worker as numba is only imported on demand.
+
+    Args:
+        numba_threads (`int`)
+            The number of threads numba may use in this worker.
+    """
+    os.environ.setdefault("NUMBA_NUM_THREADS", str(numba_threads))
 
 
 ###
@@ -198,6 +513,7 @@ def convert_file_to_pd_dataframe(
     parsed_datetime_column_name: str | None = "datetime",
     drop_original_datetime_column: bool = False,
     put_parsed_datetime_column_first: bool = True,
+    downcast_numeric: bool = False,
 ) -> pd.DataFrame:
     """
     Converts a DBF/IDX file pair, as exported from RSTrendX's trending / "Create Snapshot" tool, to a pandas dataframe.
@@ -238,92 +554,174 @@ def convert_file_to_pd_dataframe(
             if provided with `parsed_datetime_column_name` arg), so optionally re-order the
             columns so that the parsed datetime column is first.
             Only active if `parsed_datetime_column_name` is not None, otherwise has no effect.
+
+        downcast_numeric (`bool`, *optional*, default=False)
+            Pen values are read as 64-bit numbers, which is more than PLC registers typically
+            need. Set this arg to True to downcast floating point columns to `float32` and
+            integer columns (e.g. "Sts_..." and "Millitm") to the smallest integer type that
+            holds their values, roughly halving the dataframe's memory use. Note that `float32`
+            has about 7 significant digits of precision.
     """
-    # handle the provided dbf file name / path
-    if isinstance(dbf_file_name_or_path, str):
-        dbf_file_handle: Path = Path(dbf_file_name_or_path)
-    elif isinstance(dbf_file_name_or_path, Path):
-        dbf_file_handle: Path = dbf_file_name_or_path
-    else:
-        raise TypeError(
-            f"{__name__}: provided argument is not a `str` or `Path` object: {dbf_file_name_or_path=}"
-        )
+    with _copy_on_write():
+        # handle the provided dbf file name / path
+        dbf_file_handle: Path = _coerce_path(dbf_file_name_or_path)
 
-    # run the conversion utility
-    df = Dbf5(dbf_file_handle).to_dataframe()
+        # run the conversion utility
+        df = _read_dbf_columnar(dbf_file_handle)
 
-    # drop status columns
-    status_cols = [col for col in df.columns if (col[0:4] == "Sts_")]
-    n_status_columns = len(status_cols)
-    if (not keep_status_columns) and (n_status_columns > 0):
-        df.drop(columns=status_cols, inplace=True)
+        # find status columns
+        status_cols = df.columns[df.columns.str.startswith("Sts_")].tolist()
+        n_status_columns = len(status_cols)
 
-    # drop "Marker" column
-    if (not keep_marker_column) and ("Marker" in df.columns):
-        df.drop(columns=["Marker"], inplace=True)
+        # handle the provided header file name / path
+        if header_file_name_or_path is None:
+            # check for IDX file with same file stem
+            shy_idx_file = Path(dbf_file_handle.parent, f"{dbf_file_handle.stem}.IDX")
 
-    # handle the provided header file name / path
-    if header_file_name_or_path is None:
-        # check for IDX file with same file stem
-        shy_idx_file = Path(dbf_file_handle.parent, f"{dbf_file_handle.stem}.IDX")
+            logger.debug(f"Shy IDX file test: {shy_idx_file=}")
 
-        logger.debug(f"Shy IDX file test: {shy_idx_file=}")
+            if shy_idx_file.exists():
+                header_dict = _parse_header_file(shy_idx_file)
 
-        if shy_idx_file.exists():
-            header_dict = _parse_header_file(shy_idx_file)
+                logger.debug(f"Shy IDX file found: {header_dict=}")
+            else:
+                header_dict = None  # placeholders created downstream
 
-            logger.debug(f"Shy IDX file found: {header_dict=}")
+                logger.debug(f"No IDX file: {header_dict=}")
         else:
-            header_dict = None  # placeholders created downstream
+            header_file_handle: Path = _coerce_path(header_file_name_or_path)
 
-            logger.debug(f"No IDX file: {header_dict=}")
-    else:
-        if isinstance(header_file_name_or_path, str):
-            header_file_handle: Path = Path(header_file_name_or_path)
-        elif isinstance(header_file_name_or_path, Path):
-            header_file_handle: Path = header_file_name_or_path
-        else:
-            raise TypeError(
-                f"{__name__}: provided argument is not a `str` or `Path` object: {header_file_name_or_path=}"
+            header_dict = _parse_header_file(header_file_handle)
+
+            logger.debug(f"Parsed header file: {header_dict=}")
+
+        # check for malformed file / empty header_dict
+        if header_dict == {} or header_dict is None:
+            header_dict = _make_placeholder_header_dict(
+                n_status_columns, missing_header_file_column_prefix
             )
+            logger.debug(f"Placeholder column names: {header_dict=}")
+
+        # parse datetime column (before the original date/time columns are dropped)
+        if parsed_datetime_column_name is not None:
+            parsed_datetime_col = _parse_date_column(df)
+
+        # drop unwanted columns and rename pen columns, in a single pass over the columns
+        drop_cols = set()
+        if not keep_status_columns:
+            drop_cols.update(status_cols)
+        if not keep_marker_column:
+            drop_cols.add("Marker")  # has no effect if there is no "Marker" column
+        if (parsed_datetime_column_name is not None) and drop_original_datetime_column:
+            drop_cols.update(["Date", "Time", "Millitm"])
+
+        df = df[[col for col in df.columns if col not in drop_cols]].rename(
+            columns=header_dict
+        )
 
-        header_dict = _parse_header_file(header_file_handle)
+        # downcast numeric columns (optional)
+        if downcast_numeric:
+            for col in df.select_dtypes("float64").columns:
+                df[col] = pd.to_numeric(df[col], downcast="float")
+            for col in df.select_dtypes("int64").columns:
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+
+        # add datetime column
+        if parsed_datetime_column_name is not None:
+            parsed_datetime_col = parsed_datetime_col.rename(parsed_datetime_column_name)
+
+            if put_parsed_datetime_column_first:
+                # the parsed column replaces any existing column of the same name
+                if parsed_datetime_column_name in df.columns:
+                    df = df.drop(columns=parsed_datetime_column_name)
+
+                # build the final frame in one step, rather than adding then re-ordering
+                df = pd.concat([parsed_datetime_col.to_frame(), df], axis=1)
+            else:
+                df[parsed_datetime_column_name] = parsed_datetime_col
+        else:
+            # If we don't make a parsed datetime column, we *shouldn't* drop the original datetime columns.
+            #   we also can't move the parsed datetime column if we hadn't created it. Either way give a warning. 
+            if (drop_original_datetime_column or put_parsed_datetime_column_first):
+                logger.warning(
+                    """Args `drop_original_datetime_column` and/or `put_parsed_datetime_column_first` had no effect
+                    because `parsed_datetime_column_name` was None, indicating no parsed datetime column should be generated."""
+                )
+
+        # all done
+        return df
+
+
+def convert_files_to_pd_dataframe(
+    dbf_file_names_or_paths: list[str | Path],
+    header_file_names_or_paths: list[str | Path | None] | None = None,
+    max_workers: int | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Converts several DBF/IDX file pairs (e.g. a trend exported as a series of snapshots) to a single
+    pandas dataframe. Files are converted in parallel, each in its own process, and the results are
+    concatenated in the order the files were provided.
 
-        logger.debug(f"Parsed header file: {header_dict=}")
+    Worker processes are always started with the "spawn" method (the default on Windows), since
+    forking a process which already has threads running (e.g. from numba) can deadlock. As a
+    result, scripts calling this function must do so under an `if __name__ == "__main__":` guard.
+    Otherwise each worker re-runs the script on import and the pool fails with `BrokenProcessPool`.
 
-    # check for malformed file / empty header_dict
-    if header_dict == {} or header_dict is None:
-        header_dict = _make_placeholder_header_dict(
-            n_status_columns, missing_header_file_column_prefix
-        )
-        logger.debug(f"Placeholder column names: {header_dict=}")
+    Args:
+        dbf_file_names_or_paths (`list` of `str` or `Path`)
+            The filenames (as strings) or Path objects referring to the main data (.DBF) files.
 
-    # rename pen columns
-    df.rename(columns=header_dict, inplace=True)
+        header_file_names_or_paths (`list` of `str` or `Path` or None, *optional*, default=None)
+            The filenames (as strings) or Path objects referring to the header (.IDX) files, one
+            per DBF file. If None, each DBF file is treated as though no header file was provided.
 
-    # add datetime column
-    if parsed_datetime_column_name is not None:
-        df[parsed_datetime_column_name] = _parse_date_column(df)
+        max_workers (`int` | None, *optional*, default=None)
+            The maximum number of processes to use. By default, one process per file is used,
+            up to the number of CPUs.
 
-        # drop original date/time columns (optional)
-        if drop_original_datetime_column:
-            df.drop(columns=['Date', 'Time', 'Millitm'], inplace=True)
+        **kwargs
+            Any other keyword args are passed to `convert_file_to_pd_dataframe()` for every file.
 
-        # rearrange the column order (optional)
-        if put_parsed_datetime_column_first:
-            datetime_col = df.pop(parsed_datetime_column_name)
-            df.insert(loc=0, column=datetime_col.name, value=datetime_col)
-    else:
-        # If we don't make a parsed datetime column, we *shouldn't* drop the original datetime columns.
-        #   we also can't move the parsed datetime column if we hadn't created it. Either way give a warning. 
-        if (drop_original_datetime_column or put_parsed_datetime_column_first):
-            logger.warning(
-                """Args `drop_original_datetime_column` and/or `put_parsed_datetime_column_first` had no effect
-                because `parsed_datetime_column_name` was None, indicating no parsed datetime column should be generated."""
+    Returns:
+        `pandas.DataFrame` of all files' contents, with a new sequential index. If the files have
+        different pens, the columns are the union of all files' columns (missing values are NaN).
+    """
+    if len(dbf_file_names_or_paths) == 0:
+        raise ValueError(f"{__name__}: no DBF files provided: {dbf_file_names_or_paths=}")
+
+    if header_file_names_or_paths is None:
+        header_file_names_or_paths = [None] * len(dbf_file_names_or_paths)
+    elif len(header_file_names_or_paths) != len(dbf_file_names_or_paths):
+        raise ValueError(
+            f"{__name__}: number of header files does not match number of DBF files: "
+            f"{header_file_names_or_paths=}, {dbf_file_names_or_paths=}"
+        )
+
+    if max_workers is None:
+        max_workers = min(len(dbf_file_names_or_paths), os.cpu_count() or 1)
+    elif max_workers < 1:
+        raise ValueError(f"{__name__}: max_workers must be at least 1: {max_workers=}")
+
+    # share the CPUs between workers, rather than each starting a thread per CPU for numba
+    numba_threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_batch_worker,
+        initargs=(numba_threads_per_worker,),
+    ) as executor:
+        dfs = list(
+            executor.map(
+                functools.partial(convert_file_to_pd_dataframe, **kwargs),
+                dbf_file_names_or_paths,
+                header_file_names_or_paths,
             )
+        )
 
     # all done
-    return df
+    return pd.concat(dfs, ignore_index=True)
 
 
 if __name__ == "__main__":
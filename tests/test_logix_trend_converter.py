@@ -6,10 +6,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 # supporting imports
 from pathlib import Path
+import struct
+import pandas as pd
 import pytest
 
 # module being tested
 from logix_trend_converter import converter
+from logix_trend_converter.dbf import Dbf5
 
 
 _DATA_DIR = Path("../tests/test_data")
@@ -34,6 +37,31 @@ _DATA_FILES = {
 }
 
 
+def _write_dbf(path, fields, records):
+    """
+    Writes a minimal version 5 DBF file for testing.
+    `fields` is a list of (name, type, size) tuples; `records` is a list of lists of raw field
+    bytes (each already padded to the field's size), optionally prefixed with b'*' to mark the
+    record as deleted.
+    """
+    record_size = 1 + sum(size for (_, _, size) in fields)
+    header_size = 32 + 32 * len(fields) + 1
+    data = bytearray(struct.pack('<4xLHH20x', len(records), header_size, record_size))
+    for (name, field_type, size) in fields:
+        data += struct.pack('<11sc4xB15x', name.encode(), field_type.encode(), size)
+    data += b'\r'
+    for record in records:
+        if record and record[0] == b'*':
+            data += b'*' + b''.join(record[1:])
+        else:
+            data += b' ' + b''.join(record)
+    data += b'\x1a'
+    Path(path).write_bytes(bytes(data))
+
+
+_TREND_FIELDS = [('Date', 'C', 10), ('Time', 'C', 8), ('Millitm', 'N', 3), ('Marker', 'C', 1)]
+
+
 ### Tests for `_parse_header_file`
 def test_header_file_bad_path():
     with pytest.raises(TypeError):
@@ -51,6 +79,21 @@ def test_header_file_empty():
         # note: don't yet have a test for the function returning "None" after exception is raised
 
 
+def test_header_file_cached(tmp_path):
+    idx_file = Path(tmp_path, 'TREND.IDX')
+    idx_file.write_bytes(b'HEADER 0N7:0  1N7:1 ')
+
+    hits_before = converter._parse_header_file_cached.cache_info().hits
+    first = converter._parse_header_file(idx_file)
+    second = converter._parse_header_file(idx_file)
+    assert first == second == {'0': 'N7:0', '1': 'N7:1'}
+    assert converter._parse_header_file_cached.cache_info().hits == hits_before + 1
+
+    # a changed file must not return the stale (cached) pen names
+    idx_file.write_bytes(b'HEADER 0F8:10  1F8:11 ')
+    assert converter._parse_header_file(idx_file) == {'0': 'F8:10', '1': 'F8:11'}
+
+
 #   TODO: determine a way to simulate bad data
 # def test_header_file_unicode_error():
 #     with pytest.raises(UnicodeDecodeError):
@@ -59,4 +102,233 @@ def test_header_file_empty():
 
 ### Tests for `_parse_date_column`
 def test_date_cols_missing():
-    pass
\ No newline at end of file
+    pass
+
+
+def test_date_cols_no_records():
+    df = pd.DataFrame({'Date': [], 'Time': [], 'Millitm': []})
+    result = converter._parse_date_column(df)
+    assert len(result) == 0
+    assert result.dtype == 'datetime64[ns]'
+
+
+def test_date_cols_single_day():
+    df = pd.DataFrame({
+        'Date': ['2023-03-23', '2023-03-23', '2023-03-23'],
+        'Time': ['18:45:20', '18:45:20', '18:45:21'],
+        'Millitm': [8, 128, 0],
+    })
+    result = converter._parse_date_column(df)
+    expected = pd.to_datetime(pd.Series([
+        '2023-03-23 18:45:20.008', '2023-03-23 18:45:20.128', '2023-03-23 18:45:21.000'
+    ]))
+    assert (result == expected).all()
+
+
+def test_date_cols_multiple_days():
+    df = pd.DataFrame({
+        'Date': ['2023-03-23', '2023-03-24'],
+        'Time': ['23:59:59', '00:00:00'],
+        'Millitm': [999, 7],
+    })
+    result = converter._parse_date_column(df)
+    expected = pd.to_datetime(pd.Series(['2023-03-23 23:59:59.999', '2023-03-24 00:00:00.007']))
+    assert (result == expected).all()
+
+
+def test_date_cols_millitm_str():
+    df = pd.DataFrame({
+        'Date': ['2023-03-23', '2023-03-23'],
+        'Time': ['18:45:20', '18:45:20'],
+        'Millitm': ['7', '128'],
+    })
+    result = converter._parse_date_column(df)
+    expected = pd.to_datetime(pd.Series(['2023-03-23 18:45:20.007', '2023-03-23 18:45:20.128']))
+    assert (result == expected).all()
+
+
+def test_date_cols_invalid_time():
+    for bad_time in ['25:00:00', '1 day']:
+        df = pd.DataFrame({
+            'Date': ['2023-03-23'],
+            'Time': [bad_time],
+            'Millitm': [0],
+        })
+        with pytest.raises(ValueError):
+            result = converter._parse_date_column(df)
+
+
+def test_date_cols_numba():
+    pytest.importorskip('numba')
+    df = pd.DataFrame({
+        'Date': ['2023-03-23', '2024-02-29', '1969-12-31'],
+        'Time': ['18:45:20', '00:00:00', '23:59:59'],
+        'Millitm': [8, 128, 999],
+    })
+    result = converter._parse_date_column_numba(df)
+    expected = pd.to_datetime(pd.Series([
+        '2023-03-23 18:45:20.008', '2024-02-29 00:00:00.128', '1969-12-31 23:59:59.999'
+    ]))
+    assert (result == expected).all()
+
+
+def test_date_cols_numba_invalid_date():
+    pytest.importorskip('numba')
+    for bad_date in ['2023-02-29', '2300-01-01', '0000-01-01']:
+        df = pd.DataFrame({
+            'Date': [bad_date],
+            'Time': ['18:45:20'],
+            'Millitm': [8],
+        })
+        assert converter._parse_date_column_numba(df) is None
+
+
+### Tests for `_read_dbf_columnar`
+def _assert_matches_dbf5(dbf_file):
+    result = converter._read_dbf_columnar(dbf_file)
+    dbf = Dbf5(dbf_file)
+    expected = dbf.to_dataframe()
+    dbf.f.close()
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_read_dbf_columnar_matches_dbf5(tmp_path):
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(
+        dbf_file,
+        _TREND_FIELDS + [('0', 'N', 8), ('1', 'N', 4), ('2', 'F', 8), ('Sts_0', 'N', 1)],
+        [
+            [b'2023-03-23', b'18:45:20', b'  8', b' ', b'   1.500', b'  12', b'   0.250', b'0'],
+            [b'*', b'2023-03-23', b'18:45:20', b' 28', b' ', b'   9.999', b'  99', b'   9.999', b'1'],
+            [b'2023-03-23', b'18:45:20', b'128', b' ', b'  -2    ', b' -34', b'        ', b'0'],
+            [b'2023-03-23', b'18:45:21', b'  0', b' ', b'        ', b'  56', b'   ***  ', b'0'],
+        ],
+    )
+    _assert_matches_dbf5(dbf_file)
+
+
+def test_read_dbf_columnar_blank_and_invalid_numbers(tmp_path):
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(
+        dbf_file,
+        [('Blank', 'C', 4), ('0', 'N', 4), ('1', 'N', 4)],
+        [
+            [b'    ', b'  12', b' ***'],
+            [b'    ', b'    ', b'  34'],
+        ],
+    )
+    _assert_matches_dbf5(dbf_file)
+
+
+def test_read_dbf_columnar_dates_and_logicals(tmp_path):
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(
+        dbf_file,
+        [('D', 'D', 8), ('Blank_D', 'D', 8), ('L', 'L', 1), ('All_L', 'L', 1), ('Blank_L', 'L', 1)],
+        [
+            [b'20230323', b'        ', b'T', b't', b'?'],
+            [b'        ', b'        ', b'F', b'y', b'?'],
+            [b'2023ab01', b'        ', b'?', b'n', b' '],
+            [b'20240229', b'        ', b'n', b'F', b'?'],
+        ],
+    )
+    _assert_matches_dbf5(dbf_file)
+
+
+def test_read_dbf_columnar_impossible_date(tmp_path):
+    # `Dbf5` raises for this, the columnar reader treats it as missing
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(dbf_file, [('D', 'D', 8)], [[b'20230230'], [b'20230301']])
+    result = converter._read_dbf_columnar(dbf_file)
+    assert pd.isna(result['D'][0])
+    assert str(result['D'][1]) == '2023-03-01'
+
+
+def test_read_dbf_columnar_truncated_file(tmp_path):
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(dbf_file, [('0', 'N', 4)], [[b'  12'], [b'  34'], [b'  56']])
+    dbf_file.write_bytes(dbf_file.read_bytes()[:-3])   # cut off the last record (and EOF marker)
+    with pytest.raises(ValueError):
+        result = converter._read_dbf_columnar(dbf_file)
+
+
+def test_read_dbf_columnar_integer_overflow(tmp_path):
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(dbf_file, [('0', 'N', 20)], [[b'99999999999999999999']])
+    result = converter._read_dbf_columnar(dbf_file)
+    assert result['0'].tolist() == [1e20]
+
+
+### Tests for `convert_file_to_pd_dataframe`
+def test_convert_file_downcast_numeric(tmp_path):
+    dbf_file = Path(tmp_path, 'TREND.DBF')
+    _write_dbf(dbf_file, _TREND_FIELDS + [('0', 'N', 8), ('Sts_0', 'N', 1)], [
+        [b'2023-03-23', b'18:45:20', b'  8', b' ', b'   1.500', b'0'],
+        [b'2023-03-23', b'18:45:20', b'128', b' ', b'  -2.250', b'1'],
+    ])
+
+    expected = converter.convert_file_to_pd_dataframe(dbf_file, keep_status_columns=True)
+    result = converter.convert_file_to_pd_dataframe(
+        dbf_file, keep_status_columns=True, downcast_numeric=True
+    )
+
+    assert result['0'].dtype == 'float32'
+    for col in ['Sts_0', 'Millitm']:
+        assert pd.api.types.is_integer_dtype(result[col])
+        assert result[col].dtype.itemsize < 8
+    pd.testing.assert_series_equal(result['datetime'], expected['datetime'])
+
+
+### Tests for `convert_files_to_pd_dataframe`
+def test_convert_files_empty_list():
+    with pytest.raises(ValueError):
+        result = converter.convert_files_to_pd_dataframe([])
+
+
+def test_convert_files_header_count_mismatch():
+    with pytest.raises(ValueError):
+        result = converter.convert_files_to_pd_dataframe(
+            [_DATA_FILES['PLC5']['DBF'], _DATA_FILES['SLC500']['DBF']],
+            [_DATA_FILES['PLC5']['IDX']],
+        )
+
+
+def test_convert_files_bad_max_workers():
+    with pytest.raises(ValueError):
+        result = converter.convert_files_to_pd_dataframe(
+            [_DATA_FILES['PLC5']['DBF']], max_workers=0
+        )
+
+
+def test_convert_files(tmp_path):
+    first_dbf = Path(tmp_path, 'FIRST.DBF')
+    _write_dbf(first_dbf, _TREND_FIELDS + [('0', 'N', 8), ('Sts_0', 'N', 1)], [
+        [b'2023-03-23', b'18:45:20', b'  0', b' ', b'   1.500', b'0'],
+        [b'2023-03-23', b'18:45:21', b'  0', b' ', b'   2.500', b'0'],
+    ])
+    second_dbf = Path(tmp_path, 'SECOND.DBF')
+    _write_dbf(
+        second_dbf,
+        _TREND_FIELDS + [('0', 'N', 8), ('1', 'N', 8), ('Sts_0', 'N', 1), ('Sts_1', 'N', 1)],
+        [[b'2023-03-23', b'18:45:22', b'  0', b' ', b'   3.500', b'  10.000', b'0', b'0']],
+    )
+
+    result = converter.convert_files_to_pd_dataframe(
+        [first_dbf, second_dbf], max_workers=2, drop_original_datetime_column=True
+    )
+
+    assert result.columns.tolist() == ['datetime', '0', '1']
+    assert result['datetime'].is_monotonic_increasing
+    assert result['0'].tolist() == [1.5, 2.5, 3.5]
+    assert result['1'].isna().tolist() == [True, True, False]
+
+
+### Tests for `_make_placeholder_header_dict`
+def test_placeholder_header_dict():
+    result = converter._make_placeholder_header_dict(12, "Pen_")
+    assert result == {i: f"Pen_{i:0>2}" for i in range(12)}
+
+
+def test_placeholder_header_dict_bad_n_columns():
+    with pytest.raises(ValueError):
+        result = converter._make_placeholder_header_dict(0)